@@ -123,6 +123,11 @@ def search(query: str, limit: int, no_interactive: bool):
             
             interactive = not no_interactive
             current_index = 0  # Track current position
+            # A single result skips the list, so there is nothing to go back to
+            has_back = len(skills) > 1
+            # Full skills already fetched this session, keyed by id. Re-opening a
+            # skill reuses the same instance and its parsed directory structure.
+            full_skills = {}
             
             # Interactive loop: search -> detail -> install/back
             while True:
@@ -137,18 +142,28 @@ def search(query: str, limit: int, no_interactive: bool):
                 
                 # Fetch full skill details
                 console.print()  # Clear line after Live display
-                full_skill = api.get_skill(selected_skill.id)
+                full_skill = full_skills.get(selected_skill.id)
+                if full_skill is None:
+                    full_skill = api.get_skill(selected_skill.id)
+                    if full_skill:
+                        full_skills[selected_skill.id] = full_skill
                 
                 if not full_skill:
                     print_error(f"Could not load skill details: {selected_skill.name}")
+                    if not has_back:
+                        # Single result: retrying would fetch the same skill forever
+                        break
                     continue
                 
-                # Show skill details with interactive options (has_back=True for search)
-                action = display_skill_detail(full_skill, interactive=interactive, has_back=True)
+                # Show skill details with interactive options (back only makes sense with a list to return to)
+                action = display_skill_detail(full_skill, interactive=interactive, has_back=has_back)
                 
                 if action == 'install':
                     # Perform installation
                     _do_install_skill(api, full_skill)
+                    if not has_back:
+                        # Single result: the list is skipped, so there is nothing to return to
+                        break
                     # After install, return to list for more browsing
                     console.print("\n[dim]🔙 Returning to search results...[/dim]")
                     continue
@@ -156,10 +171,10 @@ def search(query: str, limit: int, no_interactive: bool):
                     # Show full directory tree
                     if full_skill.directory_structure:
                         console.clear()
-                        from .display import display_directory_tree, _read_key
+                        from .display import display_directory_tree, _get_dir_data, _read_key
                         
                         try:
-                            dir_data = json.loads(full_skill.directory_structure) if isinstance(full_skill.directory_structure, str) else full_skill.directory_structure
+                            dir_data = _get_dir_data(full_skill)
                             display_directory_tree(dir_data, full_skill.name)
                         except:
                             console.print("[red]Could not parse directory structure.[/red]")
@@ -173,9 +188,11 @@ def search(query: str, limit: int, no_interactive: bool):
                     # We need to hack the loop slightly or just let it continue to show list then re-select?
                     # actually, 'continue' goes to list. Ideally we want to stay in detail.
                     # Simple fix: Let's just re-display detail immediately
-                    action = display_skill_detail(full_skill, interactive=interactive, has_back=True)
+                    action = display_skill_detail(full_skill, interactive=interactive, has_back=has_back)
                     if action == 'install':
                          _do_install_skill(api, full_skill)
+                         if not has_back:
+                             break
                          continue
                     elif action == 'back':
                          continue
@@ -553,8 +570,8 @@ def list_skills(path: bool):
         console.print("[dim]Use 'skill search <query>' to find skills and 'skill install <name>' to install.[/dim]\n")
         return
     
-    # Convert to InstalledSkill objects
-    skills = [InstalledSkill.from_dict(data) for data in installed.values()]
+    # Convert to InstalledSkill objects lazily, one row at a time
+    skills = (InstalledSkill.from_dict(data) for data in installed.values())
     
     display_installed_list(skills)
 
@@ -2,10 +2,22 @@
 Rich display formatting for Skill CLI
 """
 
-from typing import List, Optional, Callable, Tuple, Any
+from typing import List, Optional, Callable, Tuple, Any, Iterable
+from contextlib import contextmanager
+from pathlib import Path
 import json
+import math
+import os
+import re
+import select
 import sys
 
+if sys.platform == 'win32':
+    import msvcrt
+else:
+    import termios
+    import tty
+
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -17,6 +29,7 @@ from rich.live import Live
 from rich.layout import Layout
 from rich.console import Group, ConsoleOptions, RenderResult
 from rich.padding import Padding
+from rich.segment import Segment
 from rich.align import Align
 from rich import box
 import io
@@ -25,11 +38,133 @@ from .models import Skill, InstalledSkill
 
 console = Console()
 
+# Home directory, shortened to "~" in displayed paths
+_HOME_STR = str(Path.home())
+_HOME_PREFIX = os.path.join(_HOME_STR, "")
+
+
+# Raw byte sequences produced by a POSIX terminal, mapped to key names
+_KEY_SEQUENCES = {
+    b'\x1b[A': 'up',
+    b'\x1b[B': 'down',
+    b'\x1b[C': 'right',
+    b'\x1b[D': 'left',
+    b'\x1b': 'escape',
+    b'\r': 'enter',
+    b'\n': 'enter',
+    b'q': 'q',
+    b'Q': 'q',
+    b'\x03': 'ctrl+c',
+}
+
+_ARROW_SEQUENCES = {name: seq for seq, name in _KEY_SEQUENCES.items() if len(seq) == 3}
+
+# How long to wait for the rest of an escape sequence before treating ESC as a
+# lone Escape press (the same idea as curses' ESCDELAY)
+_ESCAPE_DELAY = 0.05
+
+# Bytes read from the tty but not yet consumed (e.g. several keys in one read)
+_pending_input = bytearray()
+
+# File descriptor currently held in raw mode by raw_mode(), if any
+_raw_fd: Optional[int] = None
+
+
+@contextmanager
+def raw_mode(fd: int):
+    """
+    Put the terminal in raw mode for the duration of an interactive session.
+    
+    Output post-processing is kept enabled so Rich can keep writing plain
+    newlines while the session is active. On Windows this is a no-op.
+    """
+    global _raw_fd
+    if sys.platform == 'win32' or _raw_fd is not None:
+        yield
+        return
+    
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setraw(fd)
+        mode = termios.tcgetattr(fd)
+        mode[1] |= termios.OPOST
+        termios.tcsetattr(fd, termios.TCSANOW, mode)
+        _raw_fd = fd
+        yield
+    finally:
+        # Bytes of keys typed ahead stay pending for the next read
+        _raw_fd = None
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
+def _utf8_length(lead: int) -> int:
+    """Number of bytes in the UTF-8 character starting with the given lead byte"""
+    if lead >= 0xF0:
+        return 4
+    if lead >= 0xE0:
+        return 3
+    if lead >= 0xC0:
+        return 2
+    return 1
+
+
+def _parse_key() -> str:
+    """Consume one key from the pending input buffer"""
+    if _pending_input[:1] == b'\x1b':
+        seq = bytes(_pending_input[:3])
+        if seq in _KEY_SEQUENCES:
+            del _pending_input[:3]
+            return _KEY_SEQUENCES[seq]
+        # Lone escape, or an unknown sequence which is swallowed as a whole
+        del _pending_input[:3 if _pending_input.startswith(b'\x1b[') else 1]
+        return 'escape'
+    
+    if _pending_input[0] >= 0x80:
+        # Multi-byte UTF-8 character: consume just this one code point
+        length = _utf8_length(_pending_input[0])
+        data = bytes(_pending_input[:length])
+        del _pending_input[:length]
+        return data.decode('utf-8', errors='ignore')
+    
+    ch = bytes(_pending_input[:1])
+    del _pending_input[:1]
+    return _KEY_SEQUENCES.get(ch, ch.decode('utf-8', errors='ignore'))
+
+
+def _fill_input(timeout: Optional[float] = None) -> bool:
+    """Read whatever the raw tty has ready into the pending buffer"""
+    if not select.select([_raw_fd], [], [], timeout)[0]:
+        return False
+    data = os.read(_raw_fd, 8)
+    _pending_input.extend(data)
+    return bool(data)
+
+
+def _count_repeats(key: str) -> int:
+    """
+    Consume further presses of an arrow key that are already waiting on stdin.
+    
+    Used to collapse a burst of auto-repeated keys into a single repaint.
+    Returns the number of extra presses consumed (always 0 on Windows).
+    """
+    seq = _ARROW_SEQUENCES.get(key)
+    if seq is None or _raw_fd is None:
+        return 0
+    
+    count = 0
+    while True:
+        if len(_pending_input) < len(seq) and not _fill_input(0):
+            break
+        if not _pending_input.startswith(seq):
+            break
+        del _pending_input[:len(seq)]
+        count += 1
+    return count
+
 
 def _read_key() -> str:
     """Read a single keypress from stdin (cross-platform)"""
     if sys.platform == 'win32':
-        import msvcrt
         key = msvcrt.getch()
         if key == b'\xe0':  # Arrow keys prefix on Windows
             key = msvcrt.getch()
@@ -46,38 +181,30 @@ def _read_key() -> str:
         elif key == b'q' or key == b'Q':
             return 'q'
         return key.decode('utf-8', errors='ignore')
-    else:
-        import tty
-        import termios
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(fd)
-            ch = sys.stdin.read(1)
-            if ch == '\x1b':  # Escape sequence
-                ch2 = sys.stdin.read(1)
-                if ch2 == '[':
-                    ch3 = sys.stdin.read(1)
-                    if ch3 == 'A':
-                        return 'up'
-                    elif ch3 == 'B':
-                        return 'down'
-                    elif ch3 == 'C':
-                        return 'right'
-                    elif ch3 == 'D':
-                        return 'left'
-                return 'escape'
-            elif ch == '\r' or ch == '\n':
-                return 'enter'
-            elif ch == 'q' or ch == 'Q':
-                return 'q'
-            elif ch == '\x03':  # Ctrl+C
-                return 'ctrl+c'
-            return ch
-        except:
+    
+    if _raw_fd is None:
+        # Not inside an interactive session: enter raw mode just for this key
+        with raw_mode(sys.stdin.fileno()):
+            return _read_key()
+    
+    try:
+        # Block until input is ready, then grab a whole escape sequence at once
+        if not _pending_input and not _fill_input():
             return None
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        # The rest of a split escape sequence may still be in flight (e.g. over SSH)
+        while (_pending_input[:1] == b'\x1b' and len(_pending_input) < 3
+               and _pending_input[1:2] in (b'', b'[')
+               and _fill_input(_ESCAPE_DELAY)):
+            pass
+        # Likewise for the continuation bytes of a UTF-8 character
+        while (_pending_input[0] >= 0x80
+               and len(_pending_input) < _utf8_length(_pending_input[0])
+               and _fill_input(_ESCAPE_DELAY)):
+            pass
+        return _parse_key()
+    except:
+        _pending_input.clear()
+        return None
 
 
 def _get_render_height(console: Console, renderable: Any, width: int) -> int:
@@ -93,10 +220,15 @@ SKILLMASTER_URL = "https://skillmaster.cc"
 PROMOTION_MSG = f"[dim]🌐 Discover more agent skills: [link={SKILLMASTER_URL}]{SKILLMASTER_URL}[/link][/dim]"
 
 
+# Star strings for every rating in the 0-5 range, indexed by the rounded-up rating
+_STAR_TABLE = tuple("⭐" * n for n in range(6))
+
+
 def rating_stars(rating: float, max_stars: int = 5) -> str:
     """Convert rating to star display using ⭐ emoji (rounded up)"""
-    import math
     num_stars = math.ceil(rating)
+    if 0 <= num_stars < len(_STAR_TABLE):
+        return _STAR_TABLE[num_stars]
     return "⭐" * num_stars
 
 
@@ -132,8 +264,53 @@ def _render_footer(text: str) -> Panel:
     )
 
 
-def _build_search_table(skills: List[Skill], query: str, selected_index: int = -1) -> Table:
-    """Build the search results table with optional selected row highlighting"""
+def _precompute_rows(skills: List[Skill]) -> List[Tuple[str, str, str, str]]:
+    """
+    Format the per-skill cell strings of the search table once.
+    
+    Returns a list of (name, description, github_stars, rating) tuples
+    that can be reused across re-renders of the table. The tuple is cached
+    on each Skill, so returning to the same results skips formatting.
+    """
+    rows = []
+    for skill in skills:
+        if skill._display_row is None:
+            skill._display_row = (
+                skill.name,
+                truncate(skill.description or "", 80),
+                f"{skill.github_stars:,}" if skill.github_stars > 0 else "-",
+                f"{rating_stars(skill.average_rating)} {skill.average_rating:.1f}",
+            )
+        rows.append(skill._display_row)
+    return rows
+
+
+def _add_search_row(table: Table, row: Tuple[str, str, str, str], selected: bool) -> None:
+    """Append one precomputed row to the search table, highlighted if selected"""
+    name, description, github_stars_display, rating_display = row
+    if selected:
+        pointer = "➤"
+        name_style = "bold cyan"
+        desc_style = "white"
+    else:
+        pointer = " "
+        name_style = "cyan"
+        desc_style = "dim"
+        
+    table.add_row(
+        Text(pointer, style="bold magenta" if selected else ""),
+        Text(name, style=name_style),
+        Text(description, style=desc_style),
+        github_stars_display,
+        rating_display,
+        style="on grey23" if selected else None
+    )
+
+
+def _build_search_table(
+    rows: List[Tuple[str, str, str, str]], query: str, selected_index: int = -1, all_selected: bool = False
+) -> Table:
+    """Build the search results table from precomputed rows with optional selected row highlighting"""
     table = Table(
         show_header=True,
         header_style="bold white",
@@ -152,35 +329,52 @@ def _build_search_table(skills: List[Skill], query: str, selected_index: int = -
     table.add_column("GitHub⭐", justify="right", style="yellow", no_wrap=True, width=10)
     table.add_column("Rating", justify="left", no_wrap=True, width=14)
 
-    for i, skill in enumerate(skills):
-        rating_display = f"{rating_stars(skill.average_rating)} {skill.average_rating:.1f}"
-        github_stars_display = f"{skill.github_stars:,}" if skill.github_stars > 0 else "-"
-        
-        # Highlight selected row
-        if i == selected_index:
-            pointer = "➤"
-            name_style = "bold cyan"
-            desc_style = "white"
-            row_style = "on struct" # distinct background if theme supports, otherwise simple
-            # Using simple bold highlighing
-        else:
-            pointer = " "
-            name_style = "cyan"
-            desc_style = "dim"
-            row_style = None
-            
-        table.add_row(
-            Text(pointer, style="bold magenta" if i == selected_index else ""),
-            Text(skill.name, style=name_style),
-            Text(truncate(skill.description or "", 80), style=desc_style),
-            github_stars_display,
-            rating_display,
-            style="on grey23" if i == selected_index else None
-        )
+    for i, row in enumerate(rows):
+        _add_search_row(table, row, all_selected or i == selected_index)
     
     return table
 
 
+class _SearchRowCache:
+    """
+    Renderable for the interactive search table that lays the table out once.
+    
+    The table is rendered twice per size - with every row plain and with every
+    row highlighted - and each refresh just swaps the selected row's line in,
+    so moving the cursor skips Rich's table layout. Rebuilt on terminal resize.
+    """
+    
+    def __init__(self, rows: List[Tuple[str, str, str, str]], query: str, selected_index: int = 0):
+        self.rows = rows
+        self.query = query
+        self.selected_index = selected_index
+        self._size = None
+        self._plain_lines: List[List[Segment]] = []
+        self._selected_lines: List[List[Segment]] = []
+        self._body_start = 0
+    
+    def _render(self, console: Console, options: ConsoleOptions) -> None:
+        self._plain_lines = console.render_lines(_build_search_table(self.rows, self.query), options)
+        self._selected_lines = console.render_lines(
+            _build_search_table(self.rows, self.query, -1, all_selected=True), options
+        )
+        # Rows are single lines (no_wrap), so the first line that differs is the first row
+        self._body_start = next(
+            (i for i, (plain, selected) in enumerate(zip(self._plain_lines, self._selected_lines)) if plain != selected),
+            0,
+        )
+        self._size = (options.max_width, options.height)
+    
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        if self._size != (options.max_width, options.height):
+            self._render(console, options)
+        
+        selected_line = self._body_start + self.selected_index
+        for i, line in enumerate(self._plain_lines):
+            yield from (self._selected_lines[i] if i == selected_line else line)
+            yield Segment.line()
+
+
 def display_search_results(skills: List[Skill], query: str, interactive: bool = True, initial_index: int = 0) -> Tuple[Optional[Skill], int]:
     """
     Display search results in a beautiful table.
@@ -195,33 +389,41 @@ def display_search_results(skills: List[Skill], query: str, interactive: bool =
         Tuple of (Selected Skill or None, selected index)
     """
     if not skills:
-        console.print(f"\n[yellow]No skills found matching '[bold]{query}[/bold]'[/yellow]")
-        console.print("[dim]Try different keywords or check spelling.[/dim]\n")
+        console.print(
+            f"\n[yellow]No skills found matching '[bold]{query}[/bold]'[/yellow]\n"
+            "[dim]Try different keywords or check spelling.[/dim]\n"
+        )
         return None, 0
     
+    if len(skills) == 1 and interactive and sys.stdin.isatty():
+        # Nothing to navigate: go straight to the only result
+        return skills[0], 0
+    
+    rows = _precompute_rows(skills)
+    
     if not interactive or not sys.stdin.isatty():
         # Non-interactive mode: just display the table
-        table = _build_search_table(skills, query)
-        console.print()
-        console.print(table)
-        console.print()
-        console.print(f"[dim]Found {len(skills)} skill(s). Use [bold]skill show <name>[/bold] for details.[/dim]")
-
-        console.print()
+        table = _build_search_table(rows, query)
+        console.print(Group(
+            "",
+            table,
+            "",
+            f"[dim]Found {len(skills)} skill(s). Use [bold]skill show <name>[/bold] for details.[/dim]",
+            "",
+        ))
         return None, 0
     
     # Interactive mode - start at initial_index
     selected_index = min(initial_index, len(skills) - 1)
     
-    from rich import box
-    
+    row_cache = _SearchRowCache(rows, query, selected_index)
     
     def render_display() -> Group:
-        table = _build_search_table(skills, query, selected_index)
+        row_cache.selected_index = selected_index
         
         # Main content panel
         main_panel = Panel(
-            table,
+            row_cache,
             title=f"[bold cyan]Search Results: {query}[/bold cyan] ({len(skills)})",
             title_align="left",
             box=box.ROUNDED,
@@ -236,78 +438,85 @@ def display_search_results(skills: List[Skill], query: str, interactive: bool =
     
     try:
         # Use Live with auto_refresh=False to prevent constant updating
-        with Live(render_display(), console=console, auto_refresh=False, screen=False) as live:
+        with raw_mode(sys.stdin.fileno()), \
+                Live(render_display(), console=console, auto_refresh=False, screen=False) as live:
             live.refresh()  # Initial render
+            last_rendered = selected_index
             while True:
                 key = _read_key()
                 
-                if key == 'up':
-                    selected_index = (selected_index - 1) % len(skills)
-                    live.update(render_display())
-                    live.refresh()
-                elif key == 'down':
-                    selected_index = (selected_index + 1) % len(skills)
-                    live.update(render_display())
-                    live.refresh()
+                if key == 'up' or key == 'down':
+                    # Presses that piled up while holding the key move together
+                    steps = 1 + _count_repeats(key)
+                    if key == 'up':
+                        steps = -steps
+                    selected_index = (selected_index + steps) % len(skills)
+                    # A burst that wraps back to the same row needs no repaint
+                    if selected_index != last_rendered:
+                        live.update(render_display())
+                        live.refresh()
+                        last_rendered = selected_index
                 elif key == 'enter':
                     return skills[selected_index], selected_index
                 elif key == 'q' or key == 'escape' or key == 'ctrl+c':
                     return None, selected_index
     except Exception as e:
         # Fallback to non-interactive mode on any error
-        console.print(f"\n[dim]Interactive mode unavailable: {e}[/dim]")
-        console.print()
-        table = _build_search_table(skills, query)
-        console.print(table)
-        console.print()
-        console.print(f"[dim]Found {len(skills)} skill(s). Use [bold]skill show <name>[/bold] for details.[/dim]")
-
-        console.print()
+        table = _build_search_table(rows, query)
+        console.print(Group(
+            f"\n[dim]Interactive mode unavailable: {e}[/dim]",
+            "",
+            table,
+            "",
+            f"[dim]Found {len(skills)} skill(s). Use [bold]skill show <name>[/bold] for details.[/dim]",
+            "",
+        ))
         return None, 0
 
+def _get_dir_data(skill: Skill) -> Optional[dict]:
+    """Return the skill's parsed directory structure, parsing the JSON only once"""
+    if skill._dir_data_cached is None and skill.directory_structure:
+        data = skill.directory_structure
+        skill._dir_data_cached = json.loads(data) if isinstance(data, str) else data
+    return skill._dir_data_cached
+
+
 def display_skill_detail(skill: Skill, interactive: bool = True, has_back: bool = True) -> Optional[str]:
     """
     Display skill details in a dual-column layout.
     """
     # --- Prepare Left Column (Metadata) ---
-    meta_rows = []
+    # Sections are separated by a blank line and written into one buffer
+    meta = io.StringIO()
     
     # Rating (Single Line)
-    meta_rows.append(f"[bold]Rating:[/bold] {rating_stars(skill.average_rating)} {skill.average_rating:.1f} ({skill.rating_count})")
+    meta.write(f"[bold]Rating:[/bold] {rating_stars(skill.average_rating)} {skill.average_rating:.1f} ({skill.rating_count})")
     
     # Stats
-    stats = []
+    stats_sep = "\n\n"
     if skill.github_stars > 0:
-        stats.append(f"⭐ {skill.github_stars:,} github stars")
+        meta.write(f"{stats_sep}⭐ {skill.github_stars:,} github stars")
+        stats_sep = "\n"
     if skill.file_size_mb > 0:
-        stats.append(f"📦 {skill.file_size_mb:.2f} MB")
-    if stats:
-        meta_rows.append("\n".join(stats))
+        meta.write(f"{stats_sep}📦 {skill.file_size_mb:.2f} MB")
         
     # Tags - blue underline links
     if skill.tags:
-        tag_links = []
+        meta.write("\n")
         for t in skill.tags:
-            tag_links.append(f"[blue underline link=https://skillmaster.cc/tag/{t.id}]#{t.name}[/blue underline link]")
-        meta_rows.append("\n".join(tag_links))
+            meta.write(f"\n[blue underline link=https://skillmaster.cc/tag/{t.id}]#{t.name}[/blue underline link]")
 
     # Links (Source | Detail)
-    links = []
+    meta.write("\n\n")
     if skill.source_url:
-        links.append(f"[blue underline link={skill.source_url}]🔗 Source[/blue underline link]")
+        meta.write(f"[blue underline link={skill.source_url}]🔗 Source[/blue underline link]  |  ")
     
     detail_url = f"https://skillmaster.cc/skill/{skill.id}"
-    links.append(f"[blue underline link={detail_url}]🌐 Detail[/blue underline link]")
-    
-    meta_rows.append("  |  ".join(links))
+    meta.write(f"[blue underline link={detail_url}]🌐 Detail[/blue underline link]")
         
     # Metadata Table inside Panel
     meta_table = Table.grid(padding=(0, 0)) # Reduced padding
-    for i, row in enumerate(meta_rows):
-        meta_table.add_row(row)
-        # Add spacer only if not the last item
-        if i < len(meta_rows) - 1:
-            meta_table.add_row("") 
+    meta_table.add_row(meta.getvalue())
         
     # Combine Meta (Install panel removed as per request)
     left_group = Group(
@@ -327,7 +536,7 @@ def display_skill_detail(skill: Skill, interactive: bool = True, has_back: bool
     
     if skill.directory_structure:
         try:
-            dir_data = json.loads(skill.directory_structure) if isinstance(skill.directory_structure, str) else skill.directory_structure
+            dir_data = _get_dir_data(skill)
             if dir_data and "root" in dir_data:
                 MAX_PREVIEW_LINES = 10
                 current_lines = 0
@@ -504,33 +713,30 @@ def display_directory_tree(dir_data: dict, name: str = "root") -> None:
     
     tree = Tree(f"📂 [bold]{root_name}[/bold]", guide_style="dim")
     
-    def add_children(parent_tree: Tree, items: list):
+    # Walk the structure with an explicit stack so deep trees can't hit the recursion limit
+    stack = [(tree, children)]
+    while stack:
+        parent_tree, items = stack.pop()
         for child in items:
             if child.get("type") == "directory":
                 child_tree = parent_tree.add(f"📁 [bold]{child['name']}[/bold]")
                 if "children" in child:
-                    add_children(child_tree, child["children"])
+                    stack.append((child_tree, child["children"]))
             else:
-                size_str = ""
-                if "size" in child and child["size"]:
-                    size_kb = child["size"] / 1024
-                    size_str = f" [dim]({size_kb:.1f} KB)[/dim]"
-                parent_tree.add(f"📄 {child['name']}{size_str}")
-    
-    if children:
-        add_children(tree, children)
+                size = child.get("size")
+                parent_tree.add(f"📄 {child['name']} [dim]({size / 1024:.1f} KB)[/dim]" if size else f"📄 {child['name']}")
     
     console.print("[bold cyan]Skill Structure:[/bold cyan]")
     console.print(tree)
 
 
-def display_installed_list(skills: List[InstalledSkill]) -> None:
-    """Display list of installed skills"""
-    if not skills:
-        console.print("\n[yellow]No skills installed yet.[/yellow]")
-        console.print("[dim]Use [bold]skill install <name>[/bold] to install a skill.[/dim]\n")
-        return
+def display_installed_list(skills: Iterable[InstalledSkill]) -> None:
+    """
+    Display list of installed skills.
     
+    Accepts any iterable (e.g. a generator); skills are consumed once and
+    counted while their rows are added.
+    """
     table = Table(
         title="📦 Installed Skills",
         title_style="bold cyan",
@@ -545,12 +751,17 @@ def display_installed_list(skills: List[InstalledSkill]) -> None:
     table.add_column("Path", style="dim")
     table.add_column("ID (short)", style="dim", width=12)
     
+    total = 0
     for skill in skills:
+        total += 1
+        
         # Format date
         date_str = skill.installed_at[:10] if skill.installed_at else "Unknown"
         
         # Shorten path for display
-        short_path = skill.path.replace(str(Path.home()), "~") if skill.path else ""
+        short_path = skill.path or ""
+        if short_path == _HOME_STR or short_path.startswith(_HOME_PREFIX):
+            short_path = "~" + short_path[len(_HOME_STR):]
         
         table.add_row(
             skill.name,
@@ -559,12 +770,20 @@ def display_installed_list(skills: List[InstalledSkill]) -> None:
             skill.id[:8] + "..." if skill.id else "",
         )
     
-    console.print()
-    console.print(table)
-    console.print()
-    console.print(f"[dim]Total: {len(skills)} skill(s) installed.[/dim]")
-
-    console.print()
+    if not total:
+        console.print(
+            "\n[yellow]No skills installed yet.[/yellow]\n"
+            "[dim]Use [bold]skill install <name>[/bold] to install a skill.[/dim]\n"
+        )
+        return
+    
+    console.print(Group(
+        "",
+        table,
+        "",
+        f"[dim]Total: {total} skill(s) installed.[/dim]",
+        "",
+    ))
 
 
 def get_download_progress() -> Progress:
@@ -620,16 +839,42 @@ def display_agent_selection(agents: list, selected_ids: list = None, interactive
     if selected_ids is None:
         selected_ids = [a['id'] for a in agents]  # All selected by default
     
-    selected = set(selected_ids)
+    # One flag per agent position, so lookups are an index instead of a hash
+    initial_ids = set(selected_ids)
+    selected = bytearray(1 if agent['id'] in initial_ids else 0 for agent in agents)
     cursor_index = 0
     
+    def selected_agent_ids() -> list:
+        return [agent['id'] for agent, flag in zip(agents, selected) if flag]
+    
     # Grid configuration
     COLS = 3
     
+    def build_cell(idx: int) -> Text:
+        """Parse the markup for a single agent cell"""
+        agent = agents[idx]
+        is_selected = selected[idx]
+        is_cursor = idx == cursor_index
+        
+        checkbox = "[cyan]■[/cyan]" if is_selected else "[dim]□[/dim]"
+        cursor_mark = "→ " if is_cursor else "  "
+        
+        if is_cursor:
+            name_style = "bold reverse"
+        elif is_selected:
+            name_style = "bold"
+        else:
+            name_style = "dim"
+            
+        # Truncate long names if needed, though most are short
+        name = agent['name']
+        return Text.from_markup(f"{cursor_mark}{checkbox} [{name_style}]{name}[/{name_style}]")
+    
+    # Parsed cells are cached; key handlers only rebuild the cells they change
+    cells = [build_cell(i) for i in range(len(agents))]
+    
     def render():
-        rows = []
         # Calculate rows needed
-        import math
         num_agents = len(agents)
         num_rows = math.ceil(num_agents / COLS)
         
@@ -642,32 +887,12 @@ def display_agent_selection(agents: list, selected_ids: list = None, interactive
             row_cells = []
             for c in range(COLS):
                 idx = r * COLS + c
-                if idx < num_agents:
-                    agent = agents[idx]
-                    is_selected = agent['id'] in selected
-                    is_cursor = idx == cursor_index
-                    
-                    checkbox = "[cyan]■[/cyan]" if is_selected else "[dim]□[/dim]"
-                    cursor_mark = "→ " if is_cursor else "  "
-                    
-                    if is_cursor:
-                        name_style = "bold reverse"
-                    elif is_selected:
-                        name_style = "bold"
-                    else:
-                        name_style = "dim"
-                        
-                    # Truncate long names if needed, though most are short
-                    name = agent['name']
-                    cell_content = f"{cursor_mark}{checkbox} [{name_style}]{name}[/{name_style}]"
-                    row_cells.append(cell_content)
-                else:
-                    row_cells.append("")
+                row_cells.append(cells[idx] if idx < num_agents else "")
             grid_table.add_row(*row_cells)
         
         main_panel = Panel(
             grid_table,
-            title=f"[bold cyan]Select Agents ({len(selected)}/{len(agents)})[/bold cyan]",
+            title=f"[bold cyan]Select Agents ({sum(selected)}/{len(agents)})[/bold cyan]",
             title_align="left",
             border_style="cyan",
             padding=(1, 2),
@@ -677,55 +902,52 @@ def display_agent_selection(agents: list, selected_ids: list = None, interactive
     if not interactive or not sys.stdin.isatty():
         console.print()
         console.print(render())
-        return list(selected)
-    
-    # Interactive selection with Live display
-    from rich.live import Live
+        return selected_agent_ids()
     
     try:
         console.print()
-        with Live(render(), console=console, auto_refresh=False, screen=False) as live:
+        with raw_mode(sys.stdin.fileno()), \
+                Live(render(), console=console, auto_refresh=False, screen=False) as live:
             live.refresh()
             while True:
                 key = _read_key()
                 
-                if key == 'up':
-                    cursor_index = (cursor_index - COLS)
-                    if cursor_index < 0: cursor_index += len(agents) # Wrap around vertically-ish or just stay? Let's generic wrap
-                    # Actually better wrap logic: 
-                    # If going up from top row, go to bottom row same col?
-                    # Simple list wrap:
-                    # cursor_index = (cursor_index - COLS) % len(agents) 
-                    # But this jumps columns if not perfect rectangle.
-                    # Let's simple clamp or wrap list-wise
-                    if cursor_index < 0: cursor_index = len(agents) + cursor_index # Wrap to end
-                    live.update(render())
-                    live.refresh()
-                elif key == 'down':
-                    cursor_index = (cursor_index + COLS)
-                    if cursor_index >= len(agents): cursor_index = cursor_index - len(agents)
-                    live.update(render())
-                    live.refresh()
-                elif key == 'left':
-                    cursor_index = (cursor_index - 1) % len(agents)
-                    live.update(render())
-                    live.refresh()
-                elif key == 'right':
-                    cursor_index = (cursor_index + 1) % len(agents)
-                    live.update(render())
-                    live.refresh()
+                if key in ('up', 'down', 'left', 'right'):
+                    previous_index = cursor_index
+                    # Presses that piled up while holding the key move together
+                    for _ in range(1 + _count_repeats(key)):
+                        if key == 'up':
+                            cursor_index = (cursor_index - COLS)
+                            if cursor_index < 0: cursor_index += len(agents) # Wrap around vertically-ish or just stay? Let's generic wrap
+                            # Actually better wrap logic: 
+                            # If going up from top row, go to bottom row same col?
+                            # Simple list wrap:
+                            # cursor_index = (cursor_index - COLS) % len(agents) 
+                            # But this jumps columns if not perfect rectangle.
+                            # Let's simple clamp or wrap list-wise
+                            if cursor_index < 0: cursor_index = len(agents) + cursor_index # Wrap to end
+                        elif key == 'down':
+                            cursor_index = (cursor_index + COLS)
+                            if cursor_index >= len(agents): cursor_index = cursor_index - len(agents)
+                        elif key == 'left':
+                            cursor_index = (cursor_index - 1) % len(agents)
+                        else:
+                            cursor_index = (cursor_index + 1) % len(agents)
+                    # A burst that wraps back to the same cell needs no repaint
+                    if cursor_index != previous_index:
+                        cells[previous_index] = build_cell(previous_index)
+                        cells[cursor_index] = build_cell(cursor_index)
+                        live.update(render())
+                        live.refresh()
                 elif key == ' ':
                     # Toggle selection
-                    agent_id = agents[cursor_index]['id']
-                    if agent_id in selected:
-                        selected.discard(agent_id)
-                    else:
-                        selected.add(agent_id)
+                    selected[cursor_index] ^= 1
+                    cells[cursor_index] = build_cell(cursor_index)
                     live.update(render())
                     live.refresh()
                 elif key == 'enter':
                     # Confirm selection
-                    if not selected:
+                    if not any(selected):
                         # Must select at least one? Or allow skipping?
                         # CLI usually implies install, so empty means nothing installed. 
                         # Return empty list is fine, main loop handles it.
@@ -737,7 +959,7 @@ def display_agent_selection(agents: list, selected_ids: list = None, interactive
     except Exception:
         console.print(render())
     
-    return list(selected)
+    return selected_agent_ids()
 
 
 def display_scope_selection(interactive: bool = True) -> str:
@@ -779,8 +1001,6 @@ def display_scope_selection(interactive: bool = True) -> str:
         console.print(render())
         return scopes[selected_index]["id"]
     
-    from rich.live import Live
-    
     try:
         console.print()
         with Live(render(), console=console, auto_refresh=False, screen=False) as live:
@@ -815,6 +1035,7 @@ def display_install_summary(skill_name: str, install_results: list, source_url:
         install_results: List of dicts with 'agent_name', 'path', 'success' keys
         source_url: Optional source URL for the skill
     """
+    # Lines are assembled as pre-styled Text, so names and paths skip the markup parser
     lines = []
     
     # Determine overall status
@@ -822,38 +1043,36 @@ def display_install_summary(skill_name: str, install_results: list, source_url:
     total_count = len(install_results)
     
     if success_count == total_count:
-        lines.append(f"[bold cyan]Successfully installed {skill_name}![/bold cyan]")
+        lines.append(Text(f"Successfully installed {skill_name}!", style="bold cyan"))
     elif success_count > 0:
-        lines.append(f"[bold yellow]Partially installed {skill_name} ({success_count}/{total_count} agents)[/bold yellow]")
+        lines.append(Text(f"Partially installed {skill_name} ({success_count}/{total_count} agents)", style="bold yellow"))
     else:
-        lines.append(f"[bold red]Failed to install {skill_name}[/bold red]")
+        lines.append(Text(f"Failed to install {skill_name}", style="bold red"))
     
-    lines.append("")
+    lines.append(Text(""))
     
     for result in install_results:
         if result['success']:
-            lines.append(f"[green]✓[/green] [bold]{result['agent_name']}[/bold]: [blue]{result['path']}[/blue]")
+            lines.append(Text.assemble(("✓", "green"), " ", (result['agent_name'], "bold"), ": ", (result['path'], "blue")))
         else:
             error_msg = result.get('error', 'Failed')
-            lines.append(f"[red]✗[/red] [bold]{result['agent_name']}[/bold]: [red]{error_msg}[/red]")
+            lines.append(Text.assemble(("✗", "red"), " ", (result['agent_name'], "bold"), ": ", (error_msg, "red")))
             
             # Add hint for permission errors
             if "Permission denied" in error_msg:
                 # Extract path from error message and suggest the parent directory fix
-                import re
                 path_match = re.search(r"'([^']+)'", error_msg)
                 if path_match:
                     failed_path = path_match.group(1)
                     # Get the parent directory for chown
-                    from pathlib import Path
                     parent_dir = str(Path(failed_path).parent)
-                    lines.append(f"  [dim yellow]💡 Fix: sudo chown -R $(whoami) {parent_dir}[/dim yellow]")
+                    lines.append(Text.assemble("  ", (f"💡 Fix: sudo chown -R $(whoami) {parent_dir}", "dim yellow")))
     
     # Add promotion link
-    lines.append("")
-    lines.append(f"[dim]Discover more skills at[/dim] [bold blue underline]https://skillmaster.cc[/bold blue underline]")
+    lines.append(Text(""))
+    lines.append(Text.assemble(("Discover more skills at", "dim"), " ", ("https://skillmaster.cc", "bold blue underline")))
     
-    content = "\n".join(lines)
+    content = Text("\n").join(lines)
     
     panel = Panel(
         content,
@@ -879,9 +1098,6 @@ def display_download_panel(skill_name: str, progress_renderable, source_url: str
     Returns:
         A Panel containing the progress bar and source URL
     """
-    from rich.console import Group
-    from rich.text import Text
-    
     if source_url:
         content = Group(
             Text.from_markup(f"[bold cyan]Source:[/bold cyan] [blue underline]{source_url}[/blue underline]"),
@@ -898,7 +1114,3 @@ def display_download_panel(skill_name: str, progress_renderable, source_url: str
         border_style="cyan",
         padding=(1, 2),
     )
-
-
-# Path needs import
-from pathlib import Path
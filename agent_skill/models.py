@@ -3,7 +3,7 @@ Data models for Skill CLI
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 
 
@@ -34,6 +34,10 @@ class Skill:
     directory_structure: Optional[str] = None
     file_size_mb: float = 0.0
     tags: List[Tag] = field(default_factory=list)
+    # Formatted search table cells, filled in lazily by the display layer
+    _display_row: Optional[Tuple[str, str, str, str]] = field(default=None, init=False, repr=False, compare=False)
+    # Parsed directory_structure, filled in lazily by the display layer
+    _dir_data_cached: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def from_dict(cls, data: dict) -> "Skill":